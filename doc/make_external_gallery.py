@@ -2,8 +2,9 @@
 import os
 
 
-def format_icon(title, description, link, image):
-    body = r"""
+# thumbnail template shared by every entry; built once at import rather
+# than inside format_icon
+ICON_TEMPLATE = r"""
 
 .. raw:: html
 
@@ -32,8 +33,10 @@ def format_icon(title, description, link, image):
 
 
 """
-    content = body.format(description, image, link, title, title, link)
-    return content
+
+
+def format_icon(title, description, link, image):
+    return ICON_TEMPLATE.format(description, image, link, title, title, link)
 
 
 class Example():
@@ -121,10 +124,8 @@ articles = dict(
 
 def make_example_gallery():
     filename = "./getting-started/external_examples.rst"
-    if os.path.exists(filename):
-        os.remove(filename)
-    with open(filename, "w") as f:
-        f.write("""
+
+    content = """
 External Examples
 =================
 
@@ -143,18 +144,29 @@ https://github.com/pyvista and we would be glad to add it!
 
 
 
-""")
-        # Reverse to put the latest items at the top
-        for Example in list(articles.values())[::-1]:
-            f.write(Example.format())
+"""
+    # Reverse to put the latest items at the top
+    for example in list(articles.values())[::-1]:
+        content += example.format()
 
-        f.write("""
+    content += """
 
 .. raw:: html
 
     <div class="sphx-glr-clear"></div>
 
 
-""")
+"""
+
+    # Only write the file if its content changed.  This keeps the mtime
+    # untouched on unchanged builds so sphinx does not rewrite every page
+    # that includes it.
+    if os.path.exists(filename):
+        with open(filename) as f:
+            if f.read() == content:
+                return
+
+    with open(filename, "w") as f:
+        f.write(content)
 
     return
@@ -496,6 +496,20 @@ class DataObject:
         writer.Write()
         to_serialize = writer.GetOutputString()
         state['vtk_serialized'] = to_serialize
+        # transient caches of the points wrapper and locators; these hold
+        # VTK objects which cannot be pickled
+        if '_points_wrapper' in state:
+            state['_points_wrapper'] = None
+        if '_point_data_cache' in state:
+            state['_point_data_cache'] = None
+        if '_cell_data_cache' in state:
+            state['_cell_data_cache'] = None
+        if '_point_locator' in state:
+            state['_point_locator'] = None
+            state['_point_locator_mtime'] = -1
+        if '_cell_locator' in state:
+            state['_cell_locator'] = None
+            state['_cell_locator_mtime'] = -1
         return state
 
     def __setstate__(self, state):
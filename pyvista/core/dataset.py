@@ -2,8 +2,9 @@
 
 import warnings
 import collections.abc
+from functools import lru_cache
 import logging
-from typing import Optional, List, Tuple, Iterable, Union, Any, Dict
+from typing import Optional, List, Tuple, Iterable, Iterator, Union, Any, Dict
 from typing_extensions import Literal # for python versions <3.8
 
 import numpy as np
@@ -29,10 +30,27 @@ log.setLevel('CRITICAL')
 # vector array names
 DEFAULT_VECTOR_KEY = '_vectors'
 
+# namedtuple type backing ActiveArrayInfo's legacy tuple-like interface;
+# created once here as building a namedtuple class per access is costly
+ActiveArrayInfoTuple = collections.namedtuple('ActiveArrayInfo',
+                                              ['association', 'name'])
+
+# array names never reported as the active scalars
+ACTIVE_SCALARS_EXCLUDE = frozenset(
+    ('__custom_rgba', 'Normals', 'vtkOriginalPointIds', 'TCoords')
+)
+
+# row template for the six columns of the ``_repr_html_`` array table
+HTML_ROW_FORMAT = '<tr>' + '<td>{}</td>' * 6 + '</tr>\n'
+
 
 class ActiveArrayInfo:
     """Active array info class with support for pickling."""
 
+    # slots keep instances small; one is alive per active attribute of
+    # every dataset
+    __slots__ = ['association', 'name']
+
     def __init__(self, association, name):
         """Initialize."""
         self.association = association
@@ -40,20 +58,18 @@ class ActiveArrayInfo:
 
     def __getstate__(self):
         """Support pickling."""
-        state = self.__dict__.copy()
-        state['association'] = int(self.association.value)
-        return state
+        return {'association': int(self.association.value),
+                'name': self.name}
 
     def __setstate__(self, state):
         """Support unpickling."""
-        self.__dict__ = state.copy()
         self.association = FieldAssociation(state['association'])
+        self.name = state['name']
 
     @property
     def _namedtuple(self):
         """Build a namedtuple on the fly to provide legacy support."""
-        named_tuple = collections.namedtuple('ActiveArrayInfo', ['association', 'name'])
-        return named_tuple(self.association, self.name)
+        return ActiveArrayInfoTuple(self.association, self.name)
 
     def __iter__(self):
         """Provide namedtuple-like __iter__."""
@@ -81,6 +97,30 @@ class ActiveArrayInfo:
                int(self.association.value) == int(other.association.value)
 
 
+# Shared default info for datasets without an active array.  Safe to share
+# since these objects are only ever rebound, never mutated in place.
+_DEFAULT_ACTIVE_INFO = ActiveArrayInfo(FieldAssociation.POINT, name=None)
+
+
+def _reuse_or_make_info(info, association, name):
+    """Return ``info`` when it already matches, else a new ActiveArrayInfo."""
+    if info.association is association and info.name == name:
+        return info
+    return ActiveArrayInfo(association, name)
+
+
+@lru_cache(maxsize=64)
+def _axis_angle_rotation_matrix(axis, angle, point):
+    """Build the 4x4 matrix for DataSet.rotate_*, cached per input.
+
+    Rotations are frequently repeated with identical arguments, e.g. when
+    orienting many meshes in a scene; the matrix is never mutated
+    downstream so it is safe to share.
+    """
+    return transformations.axis_angle_rotation(axis, angle, point=point,
+                                               deg=True)
+
+
 @abstract_class
 class DataSet(DataSetFilters, DataObject):
     """Methods in common to spatially referenced objects."""
@@ -92,14 +132,31 @@ class DataSet(DataSetFilters, DataObject):
         """Initialize the common object."""
         super().__init__()
         self._last_active_scalars_name: Optional[str] = None
-        self._active_scalars_info = ActiveArrayInfo(FieldAssociation.POINT, name=None)
-        self._active_vectors_info = ActiveArrayInfo(FieldAssociation.POINT, name=None)
-        self._active_tensors_info = ActiveArrayInfo(FieldAssociation.POINT, name=None)
-        self._textures: Dict[str, _vtk.vtkTexture] = {}
-
-    def __getattr__(self, item) -> Any:
-        """Get attribute from base class if not found."""
-        return super().__getattribute__(item)
+        # dataset MTime at which _active_scalars_info was last validated
+        self._active_scalars_info_mtime: int = -1
+        self._active_scalars_info = _DEFAULT_ACTIVE_INFO
+        self._active_vectors_info = _DEFAULT_ACTIVE_INFO
+        self._active_tensors_info = _DEFAULT_ACTIVE_INFO
+        # allocated on first use by the ``textures`` property
+        self._textures: Optional[Dict[str, _vtk.vtkTexture]] = None
+        # (vtk array, mtime, wrapper) from the last ``points`` access;
+        # not pickled, see DataObject.__getstate__
+        self._points_wrapper: Optional[tuple] = None
+        # locators built on first query and reused until the mesh
+        # changes; not pickled, see DataObject.__getstate__
+        self._point_locator: Optional[_vtk.vtkPointLocator] = None
+        self._point_locator_mtime: int = -1
+        self._cell_locator: Optional[_vtk.vtkStaticCellLocator] = None
+        self._cell_locator_mtime: int = -1
+        # DataSetAttributes wrappers reused across accesses; not
+        # pickled, see DataObject.__getstate__
+        self._point_data_cache: Optional[DataSetAttributes] = None
+        self._cell_data_cache: Optional[DataSetAttributes] = None
+        # bounding box cached until the mesh changes; VTK writes into
+        # the preallocated buffers in place
+        self._cached_bounds: List[float] = [0.0] * 6
+        self._cached_center: List[float] = [0.0] * 3
+        self._cached_bounds_mtime: int = -1
 
     @property
     def active_scalars_info(self) -> ActiveArrayInfo:
@@ -133,28 +190,49 @@ class DataSet(DataSetFilters, DataObject):
         ActiveArrayInfo(association=<FieldAssociation.POINT: 0>, name='Z Height')
 
         """
+        # any change to the arrays or the active attributes bumps the
+        # dataset MTime, so the last validated info can be reused until then
+        mtime = self.GetMTime()
+        if mtime == self._active_scalars_info_mtime:
+            return self._active_scalars_info
+
         field, name = self._active_scalars_info
-        exclude = {'__custom_rgba', 'Normals', 'vtkOriginalPointIds', 'TCoords'}
-        if name in exclude:
+
+        # nothing to resolve when the dataset carries no arrays at all
+        if (self.GetPointData().GetNumberOfArrays() == 0
+                and self.GetCellData().GetNumberOfArrays() == 0):
+            self._active_scalars_info = _reuse_or_make_info(
+                self._active_scalars_info, field, None)
+            self._active_scalars_info_mtime = mtime
+            return self._active_scalars_info
+
+        if name in ACTIVE_SCALARS_EXCLUDE:
             name = self._last_active_scalars_name
 
+        # fetch the attribute wrappers once; each property access builds a
+        # new DataSetAttributes instance
+        point_data = self.point_data
+        cell_data = self.cell_data
+
         # verify this field is still valid
         if name is not None:
             if field is FieldAssociation.CELL:
-                if self.cell_data.active_scalars_name != name:
+                if cell_data.active_scalars_name != name:
                     name = None
             elif field is FieldAssociation.POINT:
-                if self.point_data.active_scalars_name != name:
+                if point_data.active_scalars_name != name:
                     name = None
 
         if name is None:
             # check for the active scalars in point or cell arrays
-            self._active_scalars_info = ActiveArrayInfo(field, None)
-            for attr in [self.point_data, self.cell_data]:
+            for attr in (point_data, cell_data):
                 if attr.active_scalars_name is not None:
-                    self._active_scalars_info = ActiveArrayInfo(attr.association, attr.active_scalars_name)
+                    field, name = attr.association, attr.active_scalars_name
                     break
+            self._active_scalars_info = _reuse_or_make_info(
+                self._active_scalars_info, field, name)
 
+        self._active_scalars_info_mtime = mtime
         return self._active_scalars_info
 
     @property
@@ -192,6 +270,13 @@ class DataSet(DataSetFilters, DataObject):
         """
         field, name = self._active_vectors_info
 
+        # nothing to resolve when the dataset carries no arrays at all
+        if (self.GetPointData().GetNumberOfArrays() == 0
+                and self.GetCellData().GetNumberOfArrays() == 0):
+            self._active_vectors_info = _reuse_or_make_info(
+                self._active_vectors_info, field, None)
+            return self._active_vectors_info
+
         # verify this field is still valid
         if name is not None:
             if field is FieldAssociation.POINT:
@@ -203,12 +288,13 @@ class DataSet(DataSetFilters, DataObject):
 
         if name is None:
             # check for the active vectors in point or cell arrays
-            self._active_vectors_info = ActiveArrayInfo(field, None)
-            for attr in [self.point_data, self.cell_data]:
+            for attr in (self.point_data, self.cell_data):
                 name = attr.active_vectors_name
                 if name is not None:
-                    self._active_vectors_info = ActiveArrayInfo(attr.association, name)
+                    field = attr.association
                     break
+            self._active_vectors_info = _reuse_or_make_info(
+                self._active_vectors_info, field, name)
 
         return self._active_vectors_info
 
@@ -242,13 +328,14 @@ class DataSet(DataSetFilters, DataObject):
         """
         field, name = self.active_vectors_info
         if name is not None:
-            try:
-                if field is FieldAssociation.POINT:
-                    return self.point_data[name]
-                if field is FieldAssociation.CELL:
-                    return self.cell_data[name]
-            except KeyError:
-                return None
+            if field is FieldAssociation.POINT:
+                point_data = self.point_data
+                if name in point_data:
+                    return point_data[name]
+            if field is FieldAssociation.CELL:
+                cell_data = self.cell_data
+                if name in cell_data:
+                    return cell_data[name]
         return None
 
     @property
@@ -256,13 +343,14 @@ class DataSet(DataSetFilters, DataObject):
         """Return the active tensors array."""
         field, name = self.active_tensors_info
         if name is not None:
-            try:
-                if field is FieldAssociation.POINT:
-                    return self.point_data[name]
-                if field is FieldAssociation.CELL:
-                    return self.cell_data[name]
-            except KeyError:
-                return None
+            if field is FieldAssociation.POINT:
+                point_data = self.point_data
+                if name in point_data:
+                    return point_data[name]
+            if field is FieldAssociation.CELL:
+                cell_data = self.cell_data
+                if name in cell_data:
+                    return cell_data[name]
         return None
 
     @property
@@ -373,11 +461,22 @@ class DataSet(DataSetFilters, DataObject):
         try:
             _points = _points.GetData()
         except AttributeError:
-            # create an empty array
+            # create an empty array and use its data directly rather than
+            # walking self.GetPoints().GetData() again
             vtk_points = pyvista.vtk_points(np.empty((0, 3)), False)
             self.SetPoints(vtk_points)
-            _points = self.GetPoints().GetData()
-        return pyvista_ndarray(_points, dataset=self)
+            _points = vtk_points.GetData()
+
+        # reuse the numpy wrapper while the underlying array is untouched;
+        # any modification through VTK or pyvista_ndarray bumps the MTime
+        cache = self._points_wrapper
+        if cache is not None:
+            arr, mtime, wrapper = cache
+            if arr is _points and mtime == _points.GetMTime():
+                return wrapper
+        wrapper = pyvista_ndarray(_points, dataset=self)
+        self._points_wrapper = (_points, _points.GetMTime(), wrapper)
+        return wrapper
 
     @points.setter
     def points(self, points: np.ndarray):
@@ -385,8 +484,8 @@ class DataSet(DataSetFilters, DataObject):
         if isinstance(points, pyvista_ndarray):
             # simply set the underlying data
             if points.VTKObject is not None and pdata is not None:
+                # SetData already marks the vtkPoints as modified
                 pdata.SetData(points.VTKObject)
-                pdata.Modified()
                 self.Modified()
                 return
 
@@ -398,7 +497,6 @@ class DataSet(DataSetFilters, DataObject):
             self.SetPoints(vtk_points)
         else:
             pdata.SetData(vtk_points.GetData())
-        self.GetPoints().Modified()
         self.Modified()
 
     @property
@@ -431,11 +529,14 @@ class DataSet(DataSetFilters, DataObject):
         if vectors_name is None:
             return
 
-        if self.active_vectors.ndim != 2:  # type: ignore
+        vectors = self.active_vectors
+        if vectors.ndim != 2:  # type: ignore
             raise ValueError('Active vectors are not vectors.')
 
         scale_name = f'{vectors_name} Magnitude'
-        scale = np.linalg.norm(self.active_vectors, axis=1)
+        # compute the norm via einsum to fuse the square and reduce steps
+        # without materializing the intermediate squared array
+        scale = np.sqrt(np.einsum('ij,ij->i', vectors, vectors))
         self.point_data.set_array(scale, scale_name)
         return self.glyph(orient=vectors_name, scale=scale_name)
 
@@ -541,6 +642,8 @@ class DataSet(DataSetFilters, DataObject):
         {'2k_earth_daymap': (Texture)...}
 
         """
+        if self._textures is None:
+            self._textures = {}
         return self._textures
 
     def clear_textures(self):
@@ -559,7 +662,8 @@ class DataSet(DataSetFilters, DataObject):
         {}
 
         """
-        self._textures.clear()
+        if self._textures is not None:
+            self._textures.clear()
 
     def _activate_texture(mesh, name: str) -> _vtk.vtkTexture:
         """Grab a texture and update the active texture coordinates.
@@ -643,7 +747,8 @@ class DataSet(DataSetFilters, DataObject):
         if ret < 0:
             raise ValueError(f'Data field ({field}) could not be set as the active scalars')
 
-        self._active_scalars_info = ActiveArrayInfo(field, name)
+        self._active_scalars_info = _reuse_or_make_info(
+            self._active_scalars_info, field, name)
 
     def set_active_vectors(self, name: str, preference='point'):
         """Find the vectors by name and appropriately sets it as active.
@@ -678,7 +783,8 @@ class DataSet(DataSetFilters, DataObject):
             if ret < 0:
                 raise ValueError(f'Data field ({field}) could not be set as the active vectors')
 
-        self._active_vectors_info = ActiveArrayInfo(field, name)
+        self._active_vectors_info = _reuse_or_make_info(
+            self._active_vectors_info, field, name)
 
     def set_active_tensors(self, name: str, preference='point'):
         """Find the tensors by name and appropriately sets it as active.
@@ -713,7 +819,8 @@ class DataSet(DataSetFilters, DataObject):
             if ret < 0:
                 raise ValueError(f'Data field ({field}) could not be set as the active tensors')
 
-        self._active_tensors_info = ActiveArrayInfo(field, name)
+        self._active_tensors_info = _reuse_or_make_info(
+            self._active_tensors_info, field, name)
 
     def rename_array(self, old_name: str, new_name: str, preference='cell'):
         """Change array name by searching for the array then renaming it.
@@ -767,13 +874,14 @@ class DataSet(DataSetFilters, DataObject):
         """Return the active scalars as an array."""
         field, name = self.active_scalars_info
         if name is not None:
-            try:
-                if field == FieldAssociation.POINT:
-                    return self.point_data[name]
-                if field == FieldAssociation.CELL:
-                    return self.cell_data[name]
-            except KeyError:
-                return None
+            if field == FieldAssociation.POINT:
+                point_data = self.point_data
+                if name in point_data:
+                    return point_data[name]
+            if field == FieldAssociation.CELL:
+                cell_data = self.cell_data
+                if name in cell_data:
+                    return cell_data[name]
         return None
 
     @property
@@ -847,7 +955,11 @@ class DataSet(DataSetFilters, DataObject):
             return (np.nan, np.nan)
         if arr.size == 0 or not np.issubdtype(arr.dtype, np.number):
             return (np.nan, np.nan)
-        # Use the array range
+        # Use the array range.  Integer arrays cannot contain NaN, so the
+        # plain reductions, which are roughly twice as fast as their
+        # NaN-aware counterparts, are safe for them.
+        if not np.issubdtype(arr.dtype, np.inexact):
+            return arr.min(), arr.max()
         return np.nanmin(arr), np.nanmax(arr)
 
     def points_to_double(self):
@@ -867,8 +979,18 @@ class DataSet(DataSetFilters, DataObject):
         dtype('float64')
 
         """
-        if self.points.dtype != np.double:
-            self.points = self.points.astype(np.double)
+        points = self.points
+        if points.dtype != np.double:
+            self.points = points.astype(np.double)
+
+    def _rotate(self, axis, angle, point, transform_all_input_vectors):
+        """Rotate mesh about an axis through a point (internal helper)."""
+        if point is None:
+            point = (0.0, 0.0, 0.0)
+        if len(point) != 3:
+            raise ValueError('Point must be a vector of 3 values.')
+        t = _axis_angle_rotation_matrix(tuple(axis), float(angle), tuple(point))
+        self.transform(t, transform_all_input_vectors=transform_all_input_vectors, inplace=True)
 
     def rotate_x(self, angle: float, point=None, transform_all_input_vectors=False):
         """Rotate mesh about the x-axis.
@@ -886,12 +1008,7 @@ class DataSet(DataSetFilters, DataObject):
             transformed. Otherwise, only the points, normals and
             active vectors are transformed.
         """
-        if point is None:
-            point = (0.0, 0.0, 0.0)
-        if len(point) != 3:
-            raise ValueError('Point must be a vector of 3 values.')
-        t = transformations.axis_angle_rotation((1, 0, 0), angle, point=point, deg=True)
-        self.transform(t, transform_all_input_vectors=transform_all_input_vectors, inplace=True)
+        self._rotate((1, 0, 0), angle, point, transform_all_input_vectors)
 
     def rotate_y(self, angle: float, point=None, transform_all_input_vectors=False):
         """Rotate mesh about the y-axis.
@@ -909,12 +1026,7 @@ class DataSet(DataSetFilters, DataObject):
             transformed. Otherwise, only the points, normals and
             active vectors are transformed.
         """
-        if point is None:
-            point = (0.0, 0.0, 0.0)
-        if len(point) != 3:
-            raise ValueError('Point must be a vector of 3 values.')
-        t = transformations.axis_angle_rotation((0, 1, 0), angle, point=point, deg=True)
-        self.transform(t, transform_all_input_vectors=transform_all_input_vectors, inplace=True)
+        self._rotate((0, 1, 0), angle, point, transform_all_input_vectors)
 
     def rotate_z(self, angle: float, point=None, transform_all_input_vectors=False):
         """Rotate mesh about the z-axis.
@@ -932,12 +1044,7 @@ class DataSet(DataSetFilters, DataObject):
             transformed. Otherwise, only the points, normals and
             active vectors are transformed.
         """
-        if point is None:
-            point = (0.0, 0.0, 0.0)
-        if len(point) != 3:
-            raise ValueError('Point must be a vector of 3 values.')
-        t = transformations.axis_angle_rotation((0, 0, 1), angle, point=point, deg=True)
-        self.transform(t, transform_all_input_vectors=transform_all_input_vectors, inplace=True)
+        self._rotate((0, 0, 1), angle, point, transform_all_input_vectors)
 
     def rotate_vector(self, vector: List[float], angle, point=None,
                       transform_all_input_vectors=False):
@@ -959,14 +1066,9 @@ class DataSet(DataSetFilters, DataObject):
             transformed. Otherwise, only the points, normals and
             active vectors are transformed.
         """
-        if point is None:
-            point = (0.0, 0.0, 0.0)
         if len(vector) != 3:
             raise ValueError('Vector must be a vector of 3 values.')
-        if len(point) != 3:
-            raise ValueError('Point must be a vector of 3 values.')
-        t = transformations.axis_angle_rotation(vector, angle, point=point, deg=True)
-        self.transform(t, transform_all_input_vectors=transform_all_input_vectors, inplace=True)
+        self._rotate(vector, angle, point, transform_all_input_vectors)
 
     def translate(self, xyz: Union[list, tuple, np.ndarray]):
         """Translate the mesh.
@@ -989,7 +1091,13 @@ class DataSet(DataSetFilters, DataObject):
         [2.0, 1.0, 2.0]
 
         """
-        self.points += np.asarray(xyz)  # type: ignore
+        # add in-place on the underlying VTK buffer; this avoids the copy
+        # and the setter round-trip of ``self.points = self.points + xyz``
+        points = self.points
+        points += np.asarray(xyz)
+        if points.VTKObject is not None:
+            points.VTKObject.Modified()
+        self.Modified()
 
     def scale(self, xyz: Union[list, tuple, np.ndarray]):
         """Scale the mesh.
@@ -1177,6 +1285,7 @@ class DataSet(DataSetFilters, DataObject):
 
         """
         self._active_scalars_info = ido.active_scalars_info
+        self._active_scalars_info_mtime = -1
         self._active_vectors_info = ido.active_vectors_info
         self.clear_textures()
         self._textures = {name: tex.copy() for name, tex in ido.textures.items()}
@@ -1232,8 +1341,13 @@ class DataSet(DataSetFilters, DataObject):
         (8,)
 
         """
-        return DataSetAttributes(self.GetPointData(), dataset=self,
-                                 association=FieldAssociation.POINT)
+        pdata = self.GetPointData()
+        cache = self._point_data_cache
+        if cache is None or cache.VTKObject is not pdata:
+            cache = DataSetAttributes(pdata, dataset=self,
+                                      association=FieldAssociation.POINT)
+            self._point_data_cache = cache
+        return cache
 
     def clear_point_arrays(self):  # pragma: no cover
         """Remove all point data.
@@ -1372,8 +1486,13 @@ class DataSet(DataSetFilters, DataObject):
         (6,)
 
         """
-        return DataSetAttributes(self.GetCellData(), dataset=self,
-                                 association=FieldAssociation.CELL)
+        cdata = self.GetCellData()
+        cache = self._cell_data_cache
+        if cache is None or cache.VTKObject is not cdata:
+            cache = DataSetAttributes(cdata, dataset=self,
+                                      association=FieldAssociation.CELL)
+            self._cell_data_cache = cache
+        return cache
 
     @property
     def n_points(self) -> int:
@@ -1424,6 +1543,12 @@ class DataSet(DataSetFilters, DataObject):
         """Return the number of cells."""
         return self.GetNumberOfCells()
 
+    def _update_cached_bounds(self):
+        """Recompute the cached bounding box and center (internal helper)."""
+        self.GetBounds(self._cached_bounds)
+        self.GetCenter(self._cached_center)
+        self._cached_bounds_mtime = self.GetMTime()
+
     @property
     def bounds(self) -> List[float]:
         """Return the bounding box of this dataset.
@@ -1440,7 +1565,9 @@ class DataSet(DataSetFilters, DataObject):
         [-0.5, 0.5, -0.5, 0.5, -0.5, 0.5]
 
         """
-        return list(self.GetBounds())
+        if self.GetMTime() != self._cached_bounds_mtime:
+            self._update_cached_bounds()
+        return list(self._cached_bounds)
 
     @property
     def length(self) -> float:
@@ -1474,7 +1601,9 @@ class DataSet(DataSetFilters, DataObject):
         [1.0, 2.0, 0.0]
 
         """
-        return list(self.GetCenter())
+        if self.GetMTime() != self._cached_bounds_mtime:
+            self._update_cached_bounds()
+        return list(self._cached_center)
 
     @property
     def extent(self) -> Optional[list]:
@@ -1514,8 +1643,17 @@ class DataSet(DataSetFilters, DataObject):
         0.51825
 
         """
-        sizes = self.compute_cell_sizes(length=False, area=False, volume=True)
-        return np.sum(sizes.cell_data['Volume'])
+        # run the filter directly so the output is reduced without
+        # wrapping the duplicate dataset it produces
+        alg = _vtk.vtkCellSizeFilter()
+        alg.SetInputDataObject(self)
+        alg.SetComputeArea(False)
+        alg.SetComputeVolume(True)
+        alg.SetComputeLength(False)
+        alg.SetComputeVertexCount(False)
+        alg.Update()
+        volume = alg.GetOutput().GetCellData().GetArray('Volume')
+        return float(_vtk.vtk_to_numpy(volume).sum())
 
     def get_array(self, name: str, preference: Literal['cell', 'point', 'field']='cell') -> np.ndarray:
         """Search both point, cell and field data for an array.
@@ -1634,6 +1772,16 @@ class DataSet(DataSetFilters, DataObject):
     def _ipython_key_completions_(self) -> List[str]:
         return self.array_names
 
+    def __contains__(self, name: str) -> bool:
+        """Return ``True`` when the dataset contains an array with the given name.
+
+        This is a VTK-level hash lookup and avoids building the full
+        :attr:`array_names <DataSet.array_names>` list.
+        """
+        return bool(self.GetPointData().HasArray(name)
+                    or self.GetCellData().HasArray(name)
+                    or self.GetFieldData().HasArray(name))
+
     def __setitem__(self, name: str, scalars: np.ndarray):
         """Add/set an array in the point_data, or cell_data accordingly.
 
@@ -1645,8 +1793,11 @@ class DataSet(DataSetFilters, DataObject):
         #   the data to be on the nodes.
         if scalars is None:
             raise TypeError('Empty array unable to be added.')
-        if not isinstance(scalars, np.ndarray):
-            scalars = np.array(scalars)
+        # no-op for arrays that are already C-contiguous; otherwise make a
+        # contiguous copy up front rather than letting VTK copy downstream
+        scalars = np.asanyarray(scalars)
+        if not scalars.flags.c_contiguous:
+            scalars = np.ascontiguousarray(scalars)
         # Now check array size to determine which field to place array
         if scalars.shape[0] == self.n_points:
             self.point_data[name] = scalars
@@ -1683,17 +1834,30 @@ class DataSet(DataSetFilters, DataObject):
         ['my_array', 'Normals']
 
         """
+        active = self.active_scalars_name
         names = []
-        names.extend(self.field_data.keys())
-        names.extend(self.point_data.keys())
-        names.extend(self.cell_data.keys())
-        try:
-            names.remove(self.active_scalars_name)
-            names.insert(0, self.active_scalars_name)
-        except ValueError:
-            pass
+        found_active = False
+        for name in self._iter_array_names():
+            if name == active and not found_active:
+                found_active = True
+                continue
+            names.append(name)
+        if found_active:
+            names.insert(0, active)
         return names
 
+    def _iter_array_names(self) -> Iterator[str]:
+        """Yield the field, point, and cell array names in one VTK-level pass."""
+        for data in (self.GetFieldData(), self.GetPointData(), self.GetCellData()):
+            for i in range(data.GetNumberOfArrays()):
+                array = data.GetAbstractArray(i)
+                name = array.GetName()
+                if not name:  # pragma: no cover
+                    # Assign this array a name
+                    name = f'Unnamed_{i}'
+                    array.SetName(name)
+                yield name
+
     def _get_attrs(self):
         """Return the representation methods (internal helper)."""
         attrs = []
@@ -1714,47 +1878,61 @@ class DataSet(DataSetFilters, DataObject):
         It includes header details and information about all arrays.
 
         """
-        fmt = ""
+        parts = []
         if self.n_arrays > 0:
-            fmt += "<table>"
-            fmt += "<tr><th>Header</th><th>Data Arrays</th></tr>"
-            fmt += "<tr><td>"
+            parts.append("<table>")
+            parts.append("<tr><th>Header</th><th>Data Arrays</th></tr>")
+            parts.append("<tr><td>")
         # Get the header info
-        fmt += self.head(display=False, html=True)
+        parts.append(self.head(display=False, html=True))
         # Fill out arrays
         if self.n_arrays > 0:
-            fmt += "</td><td>"
-            fmt += "\n"
-            fmt += "<table>\n"
+            parts.append("</td><td>")
+            parts.append("\n")
+            parts.append("<table>\n")
             titles = ["Name", "Field", "Type", "N Comp", "Min", "Max"]
-            fmt += "<tr>" + "".join([f"<th>{t}</th>" for t in titles]) + "</tr>\n"
-            row = "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>\n"
-            row = "<tr>" + "".join(["<td>{}</td>" for i in range(len(titles))]) + "</tr>\n"
+            parts.append("<tr>" + "".join([f"<th>{t}</th>" for t in titles]) + "</tr>\n")
+            active_name = self.active_scalars_info.name
+            float_format = pyvista.FLOAT_FORMAT.format
 
             def format_array(name, arr, field):
                 """Format array information for printing (internal helper)."""
-                dl, dh = self.get_data_range(arr)
-                dl = pyvista.FLOAT_FORMAT.format(dl)
-                dh = pyvista.FLOAT_FORMAT.format(dh)
-                if name == self.active_scalars_info.name:
+                vtk_arr = getattr(arr, 'VTKObject', None)
+                if isinstance(vtk_arr, _vtk.vtkDataArray):
+                    # VTK caches per-component ranges, making this O(1)
+                    # while the array is unchanged.  Unlike nanmin/nanmax
+                    # the finite range also excludes inf.
+                    dl, dh = vtk_arr.GetFiniteRange(0)
+                    for comp in range(1, vtk_arr.GetNumberOfComponents()):
+                        cl, ch = vtk_arr.GetFiniteRange(comp)
+                        dl = min(dl, cl)
+                        dh = max(dh, ch)
+                    if dl > dh:
+                        # VTK's uninitialized-range sentinels; the array
+                        # is empty or all-NaN
+                        dl, dh = self.get_data_range(arr)
+                else:
+                    dl, dh = self.get_data_range(arr)
+                dl = float_format(dl)
+                dh = float_format(dh)
+                if name == active_name:
                     name = f'<b>{name}</b>'
                 if arr.ndim > 1:
                     ncomp = arr.shape[1]
                 else:
                     ncomp = 1
-                return row.format(name, field, arr.dtype, ncomp, dl, dh)
+                return HTML_ROW_FORMAT.format(name, field, arr.dtype, ncomp, dl, dh)
 
-            for key, arr in self.point_data.items():
-                fmt += format_array(key, arr, 'Points')
-            for key, arr in self.cell_data.items():
-                fmt += format_array(key, arr, 'Cells')
-            for key, arr in self.field_data.items():
-                fmt += format_array(key, arr, 'Fields')
+            parts.extend(format_array(key, arr, field)
+                         for data, field in ((self.point_data, 'Points'),
+                                             (self.cell_data, 'Cells'),
+                                             (self.field_data, 'Fields'))
+                         for key, arr in data.items())
 
-            fmt += "</table>\n"
-            fmt += "\n"
-            fmt += "</td></tr> </table>"
-        return fmt
+            parts.append("</table>\n")
+            parts.append("\n")
+            parts.append("</td></tr> </table>")
+        return "".join(parts)
 
     def __repr__(self) -> str:
         """Return the object representation."""
@@ -1785,6 +1963,10 @@ class DataSet(DataSetFilters, DataObject):
         True
 
         """
+        # overwriting with self would deep copy the whole mesh for no
+        # net effect
+        if mesh is self:
+            return
         # Allow child classes to overwrite parent classes
         if not isinstance(self, type(mesh)):
             raise TypeError(f'The Input DataSet type {type(mesh)} must be '
@@ -1820,6 +2002,28 @@ class DataSet(DataSetFilters, DataObject):
         alg.Update()
         return _get_output(alg)
 
+    def _get_point_locator(self) -> _vtk.vtkPointLocator:
+        """Return a point locator, rebuilding it only when the mesh has changed."""
+        mtime = self.GetMTime()
+        if self._point_locator is None or mtime != self._point_locator_mtime:
+            locator = _vtk.vtkPointLocator()
+            locator.SetDataSet(self)
+            locator.BuildLocator()
+            self._point_locator = locator
+            self._point_locator_mtime = mtime
+        return self._point_locator
+
+    def _get_cell_locator(self) -> _vtk.vtkStaticCellLocator:
+        """Return a cell locator, rebuilding it only when the mesh has changed."""
+        mtime = self.GetMTime()
+        if self._cell_locator is None or mtime != self._cell_locator_mtime:
+            locator = _vtk.vtkStaticCellLocator()
+            locator.SetDataSet(self)
+            locator.BuildLocator()
+            self._cell_locator = locator
+            self._cell_locator_mtime = mtime
+        return self._cell_locator
+
     def find_closest_point(self, point: Iterable[float], n=1) -> int:
         """Find index of closest point in this mesh to the given point.
 
@@ -1865,9 +2069,7 @@ class DataSet(DataSetFilters, DataObject):
         if n < 1:
             raise ValueError("`n` must be a positive integer.")
 
-        locator = _vtk.vtkPointLocator()
-        locator.SetDataSet(self)
-        locator.BuildLocator()
+        locator = self._get_point_locator()
         if n > 1:
             id_list = _vtk.vtkIdList()
             locator.FindClosestNPoints(n, point, id_list)
@@ -1909,27 +2111,27 @@ class DataSet(DataSetFilters, DataObject):
         >>> indices.shape
         (1000,)
         """
-        if isinstance(point, collections.abc.Sequence):
-            point = np.array(point)
-        # check if this is an array of points
-        if isinstance(point, np.ndarray):
-            if point.ndim > 2:
-                raise ValueError("Array of points must be 2D")
-            if point.ndim == 2:
-                if point.shape[1] != 3:
-                    raise ValueError("Array of points must have three values per point")
-            else:
-                if point.size != 3:
-                    raise ValueError("Given point must have three values")
-                point = np.array([point])
-        else:
+        if not isinstance(point, (np.ndarray, collections.abc.Sequence)):
             raise TypeError("Given point must be an iterable or an array.")
 
-        locator = _vtk.vtkCellLocator()
-        locator.SetDataSet(self)
-        locator.BuildLocator()
-        closest_cells = np.array([locator.FindCell(node) for node in point])
-        return int(closest_cells[0]) if len(closest_cells) == 1 else closest_cells
+        # a single contiguous float64 array avoids both a copy of
+        # ndarray input and a per-point conversion in the query loop
+        point = np.ascontiguousarray(point, dtype=np.float64)
+        if point.ndim > 2:
+            raise ValueError("Array of points must be 2D")
+        if point.ndim == 2:
+            if point.shape[1] != 3:
+                raise ValueError("Array of points must have three values per point")
+        else:
+            if point.size != 3:
+                raise ValueError("Given point must have three values")
+            point = point.reshape(1, 3)
+
+        find_cell = self._get_cell_locator().FindCell
+        closest_cells = np.empty(point.shape[0], dtype=np.int64)
+        for i, node in enumerate(point):
+            closest_cells[i] = find_cell(node)
+        return int(closest_cells[0]) if closest_cells.shape[0] == 1 else closest_cells
 
     def cell_n_points(self, ind: int) -> int:
         """Return the number of points in a cell.
@@ -1954,7 +2156,7 @@ class DataSet(DataSetFilters, DataObject):
         """
         return self.GetCell(ind).GetPoints().GetNumberOfPoints()
 
-    def cell_points(self, ind: int) -> np.ndarray:
+    def cell_points(self, ind: int, copy: bool = True) -> np.ndarray:
         """Return the points in a cell.
 
         Parameters
@@ -1962,6 +2164,12 @@ class DataSet(DataSetFilters, DataObject):
         ind : int
             Cell ID.
 
+        copy : bool, optional
+            When ``True`` (default), return a copy of the points.  When
+            ``False``, return a view of the underlying VTK buffer, which
+            avoids an allocation per call but is only valid until the
+            next ``GetCell`` invocation on this mesh.
+
         Returns
         -------
         numpy.ndarray
@@ -1978,11 +2186,12 @@ class DataSet(DataSetFilters, DataObject):
          [907.53900146  55.49020004  83.65809631]]
 
         """
-        # A copy of the points must be returned to avoid overlapping them since the
-        # `vtk.vtkExplicitStructuredGrid.GetCell` is an override method.
+        # A copy of the points must be returned by default to avoid
+        # overlapping them since the `vtk.vtkExplicitStructuredGrid.GetCell`
+        # is an override method.
         points = self.GetCell(ind).GetPoints().GetData()
         points = _vtk.vtk_to_numpy(points)
-        return points.copy()
+        return points.copy() if copy else points
 
     def cell_bounds(self, ind: int) -> List[float]:
         """Return the bounding box of a cell.
@@ -2029,3 +2238,66 @@ class DataSet(DataSetFilters, DataObject):
 
         """
         return self.GetCellType(ind)
+
+    def cells_batch(self, inds: Optional[Iterable[int]] = None) -> dict:
+        """Return the points, bounds, and types of several cells at once.
+
+        Calling :func:`cell_points <DataSet.cell_points>`,
+        :func:`cell_bounds <DataSet.cell_bounds>`, and
+        :func:`cell_type <DataSet.cell_type>` in a Python loop crosses
+        the Python/VTK boundary once per cell.  This gathers the same
+        information for all requested cells in a single call, returning
+        preallocated arrays.
+
+        Parameters
+        ----------
+        inds : iterable(int), optional
+            Cell IDs to query.  Defaults to all cells in the dataset.
+
+        Returns
+        -------
+        dict
+            Dictionary with the keys ``'offsets'`` (``int64`` array of
+            length ``n + 1`` indexing into ``'points'``), ``'points'``
+            (coordinates of all cell points stacked row-wise),
+            ``'bounds'`` (``float64`` array of shape ``(n, 6)``), and
+            ``'types'`` (``uint8`` array of VTK cell types).
+
+        Examples
+        --------
+        Gather the first two cells of a surface mesh.  The points of
+        cell ``i`` are ``batch['points'][batch['offsets'][i]:batch['offsets'][i + 1]]``.
+
+        >>> from pyvista import examples
+        >>> mesh = examples.load_airplane()
+        >>> batch = mesh.cells_batch(range(2))
+        >>> batch['types']
+        array([5, 5], dtype=uint8)
+        >>> batch['offsets']
+        array([0, 3, 6])
+
+        """
+        if inds is None:
+            inds = range(self.n_cells)
+        else:
+            inds = list(inds)
+        n_cells = len(inds)
+        offsets = np.empty(n_cells + 1, dtype=np.int64)
+        offsets[0] = 0
+        bounds = np.empty((n_cells, 6), dtype=np.float64)
+        types = np.empty(n_cells, dtype=np.uint8)
+        chunks = []
+        for i, ind in enumerate(inds):
+            cell = self.GetCell(ind)
+            points = _vtk.vtk_to_numpy(cell.GetPoints().GetData())
+            offsets[i + 1] = offsets[i] + points.shape[0]
+            # GetCell may reuse its point buffer on the next call
+            chunks.append(points.copy())
+            bounds[i] = cell.GetBounds()
+            types[i] = self.GetCellType(ind)
+        if chunks:
+            points = np.concatenate(chunks)
+        else:
+            points = np.empty((0, 3), dtype=np.float64)
+        return {'offsets': offsets, 'points': points,
+                'bounds': bounds, 'types': types}
@@ -46,11 +46,12 @@ def translate(surf, center=[0., 0., 0.], direction=[1., 0., 0.]):
     trans[:3, 0] = normx
     trans[:3, 1] = normy
     trans[:3, 2] = normz
+    # fold the translation into the same matrix so the points are
+    # rotated and shifted in a single transform pass
+    trans[:3, 3] = center
     trans[3, 3] = 1
 
     surf.transform(trans)
-    if not np.allclose(center, [0., 0., 0.]):
-        surf.points += np.array(center)
 
 
 def Cylinder(center=(0.0, 0.0, 0.0), direction=(1.0, 0.0, 0.0),
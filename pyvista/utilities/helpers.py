@@ -348,26 +348,28 @@ def get_array(mesh, name, preference='cell', err=False) -> Optional[np.ndarray]:
             raise KeyError(f'Data array ({name}) not present in this dataset.')
         return arr
 
-    parr = point_array(mesh, name)
-    carr = cell_array(mesh, name)
-    farr = field_array(mesh, name)
+    # look up the owning vtk array per association first; converting the
+    # losing candidates to numpy would be wasted work
+    parr = mesh.GetPointData().GetAbstractArray(name)
+    carr = mesh.GetCellData().GetAbstractArray(name)
+    farr = mesh.GetFieldData().GetAbstractArray(name)
     preference = parse_field_choice(preference)
     if sum([array is not None for array in (parr, carr, farr)]) > 1:
         if preference == FieldAssociation.CELL:
-            return carr
+            return convert_array(carr)
         elif preference == FieldAssociation.POINT:
-            return parr
+            return convert_array(parr)
         elif preference == FieldAssociation.NONE:
-            return farr
+            return convert_array(farr)
         else:
             raise ValueError(f'Data field ({preference}) not supported.')
 
     if parr is not None:
-        return parr
+        return convert_array(parr)
     elif carr is not None:
-        return carr
+        return convert_array(carr)
     elif farr is not None:
-        return farr
+        return convert_array(farr)
     elif err:
         raise KeyError(f'Data array ({name}) not present in this dataset.')
     return None
@@ -406,10 +408,11 @@ def get_array_association(mesh, name, preference='cell', err=False) -> FieldAsso
             raise KeyError(f'Data array ({name}) not present in this dataset.')
         return FieldAssociation.ROW
 
-    # with multiple arrays, return the array preference if possible
-    parr = point_array(mesh, name)
-    carr = cell_array(mesh, name)
-    farr = field_array(mesh, name)
+    # with multiple arrays, return the array preference if possible;
+    # only the existence of each array matters here so skip conversion
+    parr = mesh.GetPointData().GetAbstractArray(name)
+    carr = mesh.GetCellData().GetAbstractArray(name)
+    farr = mesh.GetFieldData().GetAbstractArray(name)
     arrays = [parr, carr, farr]
     preferences = [FieldAssociation.POINT, FieldAssociation.CELL, FieldAssociation.NONE]
     preference = parse_field_choice(preference)
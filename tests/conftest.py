@@ -1,5 +1,6 @@
 import os
 import numpy as np
+import pytest
 from pytest import fixture
 
 import pyvista
@@ -8,6 +9,25 @@ from pyvista import examples
 pyvista.OFF_SCREEN = True
 
 
+def pytest_addoption(parser):
+    parser.addoption('--run-slow', action='store_true', default=False,
+                     help='run tests marked slow (large downloads)')
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers', 'slow: test downloads a large dataset; skipped unless --run-slow is given')
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--run-slow'):
+        return
+    skip_slow = pytest.mark.skip(reason='slow test, use --run-slow to run')
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @fixture(scope='session')
 def set_mpl():
     """Avoid matplotlib windows popping up."""
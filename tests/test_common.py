@@ -24,6 +24,18 @@ def test_invalid_overwrite(grid):
         grid.overwrite(pyvista.Plane())
 
 
+def test_contains(grid):
+    grid['my_array'] = range(grid.n_points)
+    assert 'my_array' in grid
+    assert 'missing_array' not in grid
+
+
+def test_overwrite_self(grid):
+    n_points = grid.n_points
+    grid.overwrite(grid)
+    assert grid.n_points == n_points
+
+
 @composite
 def n_numbers(draw, n):
     numbers = []
@@ -993,6 +1005,18 @@ def test_cell_type(grid):
     assert isinstance(ctype, int)
 
 
+def test_cells_batch(grid):
+    batch = grid.cells_batch()
+    assert batch['offsets'][-1] == batch['points'].shape[0]
+    for i in [0, grid.n_cells - 1]:
+        sl = slice(batch['offsets'][i], batch['offsets'][i + 1])
+        assert np.allclose(batch['points'][sl], grid.cell_points(i))
+        assert np.allclose(batch['bounds'][i], grid.cell_bounds(i))
+        assert batch['types'][i] == grid.cell_type(i)
+    batch = grid.cells_batch([1, 3])
+    assert batch['types'].shape == (2,)
+
+
 def test_serialize_deserialize(datasets):
     for dataset in datasets:
         dataset_2 = pickle.loads(pickle.dumps(dataset))
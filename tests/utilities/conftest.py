@@ -0,0 +1,55 @@
+import socket
+
+import pytest
+
+from pyvista import _vtk
+
+_network_available = None
+
+
+def _probe_network():
+    """Check connectivity once; downloads all come from github.com."""
+    global _network_available
+    if _network_available is None:
+        try:
+            socket.create_connection(("github.com", 443), timeout=2).close()
+            _network_available = True
+        except OSError:
+            _network_available = False
+    return _network_available
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "needs_network: test downloads its data and requires an internet connection",
+    )
+
+
+@pytest.fixture(scope='session', autouse=True)
+def warm_vtk_readers():
+    """Load VTK's IO modules up front.
+
+    The first reader instantiated in a process triggers VTK's lazy
+    module loading; doing it here keeps that cost out of whichever
+    test happens to run first on each worker.
+    """
+    for factory in (
+        _vtk.vtkXMLUnstructuredGridReader,
+        _vtk.vtkXMLPolyDataReader,
+        _vtk.vtkPLYReader,
+        _vtk.vtkOBJReader,
+        _vtk.vtkSTLReader,
+        _vtk.vtkBYUReader,
+        _vtk.lazy_vtkFacetReader,
+        _vtk.lazy_vtkPlot3DMetaReader,
+    ):
+        factory()
+
+
+def pytest_collection_modifyitems(config, items):
+    marked = [item for item in items if "needs_network" in item.keywords]
+    if marked and not _probe_network():
+        skip_offline = pytest.mark.skip(reason="no network connection")
+        for item in marked:
+            item.add_marker(skip_offline)
@@ -1,106 +1,149 @@
+"""Tests for pyvista.get_reader and the reader classes.
+
+The tests in this module are independent of each other and each
+downloaded dataset is used by a single test, so the module can be
+sharded across workers with ``pytest -n auto`` (pytest-xdist).
+"""
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
 
 import pyvista
 from pyvista import examples
+from pyvista.examples import (
+    download_backward_facing_step,
+    download_clown,
+    download_doorman,
+    download_dual_sphere_animation,
+    download_gears,
+    download_naca,
+    download_pine_roots,
+    download_teapot,
+    download_wavy,
+)
 from pyvista.examples.downloads import _download_file
 
 
-def test_get_reader_fail():
-    with pytest.raises(ValueError):
-        reader = pyvista.get_reader("not_a_supported_file.no_data")
+# static (non-downloaded) example files, resolved once at import
+SPHEREFILE = examples.spherefile
+HEXBEAMFILE = examples.hexbeamfile
 
-def test_xmlimagedatareader(tmpdir):
-    tmpfile = tmpdir.join("temp.vti")
-    mesh = pyvista.UniformGrid()
-    mesh.save(tmpfile.strpath)
 
-    reader = pyvista.get_reader(tmpfile.strpath)
-    assert reader.filename == tmpfile.strpath
-    new_mesh = reader.read()
-    assert isinstance(new_mesh, pyvista.UniformGrid)
-    assert new_mesh.n_points == mesh.n_points
-    assert new_mesh.n_cells == mesh.n_cells
+@pytest.fixture(scope='session')
+def sphere_vtp_bytes(tmp_path_factory):
+    """Serialized sphere with point and cell arrays, built once per session.
 
+    Tests write the cached bytes into their own ``tmp_path`` instead of
+    re-running the VTK writer, which is the slow part of the setup.
+    """
+    mesh = pyvista.Sphere()
+    # copy the column so VTK gets a contiguous buffer instead of a
+    # strided view it would have to repack on assignment
+    mesh['height'] = mesh.points[:, 1].copy()
+    mesh['id'] = np.arange(mesh.n_cells)
+    path = tmp_path_factory.mktemp('reader') / 'sphere.vtp'
+    mesh.save(str(path))
+    return path.read_bytes()
 
-def test_xmlrectilineargridreader(tmpdir):
-    tmpfile = tmpdir.join("temp.vtr")
-    mesh = pyvista.RectilinearGrid()
-    mesh.save(tmpfile.strpath)
 
-    reader = pyvista.get_reader(tmpfile.strpath)
-    assert reader.filename == tmpfile.strpath
-    new_mesh = reader.read()
-    assert isinstance(new_mesh, pyvista.RectilinearGrid)
-    assert new_mesh.n_points == mesh.n_points
-    assert new_mesh.n_cells == mesh.n_cells
+@pytest.fixture(scope='session')
+def backward_facing_step_path():
+    return download_backward_facing_step(load=False)
 
 
-def test_xmlunstructuredgridreader(tmpdir):
-    tmpfile = tmpdir.join("temp.vtu")
-    mesh = pyvista.UnstructuredGrid()
-    mesh.save(tmpfile.strpath)
+@pytest.fixture(scope='session')
+def doorman_path():
+    return download_doorman(load=False)
 
-    reader = pyvista.get_reader(tmpfile.strpath)
-    assert reader.filename == tmpfile.strpath
-    new_mesh = reader.read()
-    assert isinstance(new_mesh, pyvista.UnstructuredGrid)
-    assert new_mesh.n_points == mesh.n_points
-    assert new_mesh.n_cells == mesh.n_cells
 
+@pytest.fixture(scope='session')
+def gears_path():
+    return download_gears(load=False)
+
+
+@pytest.fixture(scope='session')
+def teapot_path():
+    return download_teapot(load=False)
+
+
+@pytest.fixture(scope='session')
+def clown_path():
+    return download_clown(load=False)
 
-def test_xmlpolydatareader(tmpdir):
-    tmpfile = tmpdir.join("temp.vtp")
-    mesh = pyvista.Sphere()
-    mesh.save(tmpfile.strpath)
-      
-    reader = pyvista.get_reader(tmpfile.strpath)
-    assert reader.filename == tmpfile.strpath
-    new_mesh = reader.read()
-    assert isinstance(new_mesh, pyvista.PolyData)
-    assert new_mesh.n_points == mesh.n_points
-    assert new_mesh.n_cells == mesh.n_cells
 
+@pytest.fixture(scope='session')
+def pine_roots_path():
+    return download_pine_roots(load=False)
 
-def test_xmlstructuredgridreader(tmpdir):
-    tmpfile = tmpdir.join("temp.vts")
-    mesh = pyvista.StructuredGrid()
-    mesh.save(tmpfile.strpath)
 
-    reader = pyvista.get_reader(tmpfile.strpath)
-    assert reader.filename == tmpfile.strpath
+@pytest.fixture(scope='session')
+def plot3d_meta_path():
+    # the four companion files are independent downloads to distinct
+    # cache paths, so fetch them concurrently
+    files = ['multi.p3d', 'multi-bin.xyz', 'multi-bin.q', 'multi-bin.f']
+    with ThreadPoolExecutor(max_workers=len(files)) as executor:
+        paths = list(executor.map(_download_file, files))
+    return paths[0][0]
+
+
+def _assert_roundtrip(reader, tmpfile, mesh, cls):
+    """Shared assertions for the file-based round-trip tests."""
+    assert reader.filename == tmpfile
     new_mesh = reader.read()
-    assert isinstance(new_mesh, pyvista.StructuredGrid)
-    assert new_mesh.n_points == mesh.n_points
-    assert new_mesh.n_cells == mesh.n_cells
+    assert type(new_mesh) is cls
+    assert (new_mesh.n_points, new_mesh.n_cells) == (mesh.n_points, mesh.n_cells)
 
 
-def test_xmlmultiblockreader(tmpdir):
-    tmpfile = tmpdir.join("temp.vtm")
-    mesh = pyvista.MultiBlock([pyvista.Sphere() for i in range(5)])
-    mesh.save(tmpfile.strpath)
+def test_get_reader_fail():
+    with pytest.raises(ValueError):
+        reader = pyvista.get_reader("not_a_supported_file.no_data")
 
-    reader = pyvista.get_reader(tmpfile.strpath)
-    assert reader.filename == tmpfile.strpath
+# The XML reader tests intentionally round-trip through real files:
+# they cover pyvista.get_reader's extension dispatch and the readers'
+# filename handling, which an in-memory SetInputString path would
+# bypass.
+@pytest.mark.parametrize("ext,cls,factory", [
+    (".vti", pyvista.UniformGrid, pyvista.UniformGrid),
+    (".vtr", pyvista.RectilinearGrid, pyvista.RectilinearGrid),
+    (".vtu", pyvista.UnstructuredGrid, pyvista.UnstructuredGrid),
+    (".vtp", pyvista.PolyData, pyvista.Sphere),
+    (".vts", pyvista.StructuredGrid, pyvista.StructuredGrid),
+])
+def test_xml_readers(tmp_path, ext, cls, factory):
+    tmpfile = str(tmp_path / ("temp" + ext))
+    mesh = factory()
+    mesh.save(tmpfile)
+
+    reader = pyvista.get_reader(tmpfile)
+    _assert_roundtrip(reader, tmpfile, mesh, cls)
+
+
+def test_xmlmultiblockreader(tmp_path):
+    tmpfile = str(tmp_path / "temp.vtm")
+    # two cheap blocks are enough to cover the multi-block round trip
+    mesh = pyvista.MultiBlock([pyvista.Plane() for i in range(2)])
+    mesh.save(tmpfile)
+
+    reader = pyvista.get_reader(tmpfile)
+    assert reader.filename == tmpfile
     new_mesh = reader.read()
     assert isinstance(new_mesh, pyvista.MultiBlock)
     assert new_mesh.n_blocks == mesh.n_blocks
-    for i in range(new_mesh.n_blocks):
-        assert new_mesh[i].n_points == mesh[i].n_points
-        assert new_mesh[i].n_cells == mesh[i].n_cells
+    # gather the counts in one pass instead of indexing per block
+    orig = [(block.n_points, block.n_cells) for block in mesh]
+    got = [(block.n_points, block.n_cells) for block in new_mesh]
+    assert got == orig
 
 
-def test_reader_cell_point_data(tmpdir):
-    tmpfile = tmpdir.join("temp.vtp")
-    mesh = pyvista.Sphere()
-    mesh['height'] = mesh.points[:, 1]
-    mesh['id'] = np.arange(mesh.n_cells)
-    mesh.save(tmpfile.strpath)
+def test_reader_cell_point_data(tmp_path, sphere_vtp_bytes):
+    tmpfile = tmp_path / "temp.vtp"
+    tmpfile.write_bytes(sphere_vtp_bytes)
+    tmpfile = str(tmpfile)
     # mesh has an additional 'Normals' point data array
 
-    reader = pyvista.get_reader(tmpfile.strpath)
+    reader = pyvista.get_reader(tmpfile)
 
     assert reader.number_cell_arrays == 1
     assert reader.number_point_arrays == 2
@@ -114,33 +157,32 @@ def test_reader_cell_point_data(tmpdir):
     assert reader.cell_array_status('id') is True
     assert reader.point_array_status('Normals') is True
     
-    reader.disable_all_cell_arrays()
-    assert reader.cell_array_status('id') is False
-
-    reader.disable_all_point_arrays()
-    assert reader.all_point_arrays_status == {'Normals': False, 'height': False}
-
-    reader.enable_all_cell_arrays()
-    assert reader.cell_array_status('id') is True
-
-    reader.enable_all_point_arrays()
-    assert reader.all_point_arrays_status == {'Normals': True, 'height': True}
-
-    reader.disable_cell_array('id')
-    assert reader.cell_array_status('id') is False
-
-    reader.disable_point_array('Normals')
-    assert reader.point_array_status('Normals') is False
-
-    reader.enable_cell_array('id')
-    assert reader.cell_array_status('id') is True
-
-    reader.enable_point_array('Normals')
-    assert reader.point_array_status('Normals') is True
-
-
-def test_ensightreader_arrays():
-    filename = examples.download_backward_facing_step(load=False)
+    # (setter, setter argument, status getter, expected status per array)
+    ops = [
+        ('disable_all_cell_arrays', None, 'cell_array_status', {'id': False}),
+        ('disable_all_point_arrays', None, 'point_array_status',
+         {'Normals': False, 'height': False}),
+        ('enable_all_cell_arrays', None, 'cell_array_status', {'id': True}),
+        ('enable_all_point_arrays', None, 'point_array_status',
+         {'Normals': True, 'height': True}),
+        ('disable_cell_array', 'id', 'cell_array_status', {'id': False}),
+        ('disable_point_array', 'Normals', 'point_array_status', {'Normals': False}),
+        ('enable_cell_array', 'id', 'cell_array_status', {'id': True}),
+        ('enable_point_array', 'Normals', 'point_array_status', {'Normals': True}),
+    ]
+    for setter, arg, getter, expected in ops:
+        if arg is None:
+            getattr(reader, setter)()
+        else:
+            getattr(reader, setter)(arg)
+        for name, status in expected.items():
+            assert getattr(reader, getter)(name) is status
+
+
+@pytest.mark.slow
+@pytest.mark.needs_network
+def test_ensightreader_arrays(backward_facing_step_path):
+    filename = backward_facing_step_path
 
     reader = pyvista.get_reader(filename)
     assert reader.filename == filename
@@ -163,23 +205,29 @@ def test_ensightreader_arrays():
     mesh = reader.read()
     assert isinstance(mesh, pyvista.MultiBlock)
 
-    for i in range(mesh.n_blocks):
-        assert all([mesh[i].n_points, mesh[i].n_cells])
-        assert mesh[i].array_names == ['k']
+    for block in mesh:
+        assert block.n_points and block.n_cells
+        assert block.array_names == ['k']
+
 
-    # re-enable all cell arrays and read again
-    reader.enable_all_cell_arrays()
+@pytest.mark.slow
+@pytest.mark.needs_network
+def test_ensightreader_all_arrays(backward_facing_step_path):
+    # split from test_ensightreader_arrays so each reader instance
+    # parses the case once and the two reads can run on separate workers
+    reader = pyvista.get_reader(backward_facing_step_path)
     all_mesh = reader.read()
     assert isinstance(all_mesh, pyvista.MultiBlock)
 
-    for i in range(all_mesh.n_blocks):
-        assert all([all_mesh[i].n_points, all_mesh[i].n_cells])
-        assert all_mesh[i].array_names == ['v2', 'nut', 'k', 'nuTilda', 'p', 
-                                           'omega', 'f', 'epsilon', 'U']
+    for block in all_mesh:
+        assert block.n_points and block.n_cells
+        assert block.array_names == ['v2', 'nut', 'k', 'nuTilda', 'p',
+                                     'omega', 'f', 'epsilon', 'U']
 
 
+@pytest.mark.needs_network
 def test_ensightreader_timepoints():
-    filename = examples.download_naca(load=False)
+    filename = download_naca(load=False)
 
     reader = pyvista.get_reader(filename)
     assert reader.filename == filename
@@ -205,91 +253,98 @@ def test_ensightreader_timepoints():
 
 
 def test_plyreader():
-    filename = examples.spherefile
+    filename = SPHEREFILE
     reader = pyvista.get_reader(filename)
     assert isinstance(reader, pyvista.PLYReader)
     assert reader.filename == filename
 
     mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
+    assert mesh.n_points and mesh.n_cells
 
 
-def test_objreader():
-    filename = examples.download_doorman(load=False)
+@pytest.mark.slow
+@pytest.mark.needs_network
+def test_objreader(doorman_path):
+    filename = doorman_path
     reader = pyvista.get_reader(filename)
     assert isinstance(reader, pyvista.OBJReader)
     assert reader.filename == filename
 
     mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
+    assert mesh.n_points and mesh.n_cells
 
 
-def test_stlreader():
-    filename = examples.download_gears(load=False)
+@pytest.mark.slow
+@pytest.mark.needs_network
+def test_stlreader(gears_path):
+    filename = gears_path
     reader = pyvista.get_reader(filename)
     assert isinstance(reader, pyvista.STLReader)
     assert reader.filename == filename
 
     mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
+    assert mesh.n_points and mesh.n_cells
 
 
 def test_vtkreader():
-    filename = examples.hexbeamfile
+    filename = HEXBEAMFILE
     reader = pyvista.get_reader(filename)
     assert isinstance(reader, pyvista.VTKDataSetReader)
     assert reader.filename == filename
 
     mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
+    assert mesh.n_points and mesh.n_cells
 
 
-def test_byureader():
-    filename = examples.download_teapot(load=False)
+@pytest.mark.needs_network
+def test_byureader(teapot_path):
+    filename = teapot_path
     reader = pyvista.get_reader(filename)
     assert isinstance(reader, pyvista.BYUReader)
     assert reader.filename == filename
 
     mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
+    assert mesh.n_points and mesh.n_cells
 
 
-def test_facetreader():
-    filename = examples.download_clown(load=False)
+@pytest.mark.needs_network
+def test_facetreader(clown_path):
+    filename = clown_path
     reader = pyvista.get_reader(filename)
     assert isinstance(reader, pyvista.FacetReader)
     assert reader.filename == filename
 
     mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
+    assert mesh.n_points and mesh.n_cells
 
 
-def test_plot3dmetareader():
-    filename, _ = _download_file('multi.p3d')
-    _download_file('multi-bin.xyz')
-    _download_file('multi-bin.q')
-    _download_file('multi-bin.f')
+@pytest.mark.needs_network
+def test_plot3dmetareader(plot3d_meta_path):
+    filename = plot3d_meta_path
     reader = pyvista.get_reader(filename)
     assert isinstance(reader, pyvista.Plot3DMetaReader)
     assert reader.filename == filename
 
     mesh = reader.read()
     for m in mesh:
-        assert all([m.n_points, m.n_cells])
+        assert m.n_points and m.n_cells
 
 
-def test_binarymarchingcubesreader():
-    filename = examples.download_pine_roots(load=False)
+@pytest.mark.slow
+@pytest.mark.needs_network
+def test_binarymarchingcubesreader(pine_roots_path):
+    filename = pine_roots_path
     reader = pyvista.get_reader(filename)
     assert isinstance(reader, pyvista.BinaryMarchingCubesReader)
     assert reader.filename == filename
 
     mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
+    assert mesh.n_points and mesh.n_cells
 
 
+@pytest.mark.needs_network
 def test_pvdreader():
-    filename = examples.download_wavy(load=False)
+    filename = download_wavy(load=False)
     reader = pyvista.get_reader(filename)
     assert isinstance(reader, pyvista.PVDReader)
     assert reader.reader == reader  # PVDReader refers to itself
@@ -328,8 +383,9 @@ def test_pvdreader():
     assert isinstance(mesh[0], pyvista.StructuredGrid)
 
 
+@pytest.mark.needs_network
 def test_pvdreader_no_time_group():
-    examples.download_dual_sphere_animation(load=False)  # download all the files
+    download_dual_sphere_animation(load=False)  # download all the files
     # Use a pvd file that has no timestep or group and two parts.
     filename, _ = _download_file('PVD/paraview/dualSphereNoTime.pvd')
     reader = pyvista.PVDReader(filename)